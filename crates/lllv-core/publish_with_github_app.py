@@ -65,8 +65,8 @@ subprocess.run(["git", "remote", "add", "origin", f"https://github.com/{org}/{re
 # Push usando GitHub App ou gh CLI
 if use_gh:
     print("📤 Fazendo push usando GitHub CLI...")
-    subprocess.run(["git", "push", "-u", "origin", "HEAD"], check=True)
-    subprocess.run(["git", "push", "origin", "v0.1.0"], check=True)
+    # Branch e tag num único push (uma conexão com o remote em vez de duas)
+    subprocess.run(["git", "push", "-u", "origin", "HEAD", "refs/tags/v0.1.0"], check=True)
     
     # Criar release
     print("🎉 Criando release no GitHub...")
@@ -80,8 +80,8 @@ else:
     print("📤 Fazendo push usando GitHub App...")
     # Para GitHub App, precisaríamos gerar um token JWT primeiro
     # Por enquanto, usar gh CLI que já está autenticado
-    subprocess.run(["git", "push", "-u", "origin", "HEAD"], check=True)
-    subprocess.run(["git", "push", "origin", "v0.1.0"], check=True)
+    # Branch e tag num único push (uma conexão com o remote em vez de duas)
+    subprocess.run(["git", "push", "-u", "origin", "HEAD", "refs/tags/v0.1.0"], check=True)
     
     subprocess.run([
         "gh", "release", "create", "v0.1.0",
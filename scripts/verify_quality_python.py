@@ -4,165 +4,561 @@ Verificador de qualidade automatizado para crates Rust
 Verifica presença e qualidade mínima de todos os itens do padrão
 """
 
+import asyncio
+import functools
+import json
 import os
+import shutil
+import signal
 import sys
 import subprocess
 import re
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Dict, List, Set, Tuple, Optional, Union
+
+try:
+    import tomllib  # Python 3.11+
+except ImportError:
+    tomllib = None
+
+# Diretórios que nunca fazem parte do código-fonte da crate: .git em
+# qualquer nível; target/ e node_modules/ na raiz. Abaixo da raiz, target/
+# só é podado se for diretório de build do cargo (tem CACHEDIR.TAG), já
+# que src/target/ pode ser um módulo Rust legítimo
+PRUNED_DIRS = (".git",)
+PRUNED_ROOT_DIRS = ("target", ".git", "node_modules")
+CARGO_TARGET_MARKER = "CACHEDIR.TAG"
+
+# Extensões ignoradas na verificação de arquivos grandes
+LARGE_FILE_EXEMPT = (".md", ".pdf", ".png", ".jpg", ".jpeg")
+LARGE_FILE_LIMIT = 1024 * 1024  # 1MB
+
+CARGO_TIMEOUT = 300  # segundos
+
+# (argumentos do cargo, descrição, obrigatório)
+CargoCheck = Tuple[List[str], str, bool]
+
+# (chave no Cargo.toml, chave textual sem tomllib, descrição, obrigatório)
+CARGO_TOML_FIELDS: List[Tuple[Tuple[str, ...], str, str, bool]] = [
+    (("package", "name"), "name", "Campo 'name'", True),
+    (("package", "version"), "version", "Campo 'version'", True),
+    (("package", "edition"), "edition", "Campo 'edition'", True),
+    (("package", "license"), "license", "Campo 'license'", True),
+    (("package", "description"), "description", "Campo 'description'", True),
+    (("package", "repository"), "repository", "Campo 'repository'", True),
+    (("package", "readme"), "readme", "Campo 'readme'", True),
+    (("package", "rust-version"), "rust-version", "Campo 'rust-version'", True),
+    (("package", "documentation"), "documentation", "Campo 'documentation'", True),
+    (("package", "exclude"), "exclude", "Campo 'exclude'", False),
+    (("package", "metadata", "docs", "rs"), "[package.metadata.docs.rs]", "Seção docs.rs", False),
+]
+
+# Cabeçalhos de tabela e as chaves textuais de CARGO_TOML_FIELDS numa única
+# regex; check_cargo_toml acompanha a tabela corrente para só contar as
+# chaves de [package]
+CARGO_TOML_KEY_RE = re.compile(
+    r"^\s*(?:\[+\s*([^\]]+?)\s*\]+"
+    r"|(name|version|edition|license|description|repository|readme|rust-version|documentation|exclude)"
+    r"(?:\.workspace)?\s*=)",
+    re.MULTILINE,
+)
+
+# Atribuições suspeitas de credenciais (password, api_key, secret, token)
+# Em bytes: o scan não precisa decodificar UTF-8 nem criar cópias em str
+SECRET_KEYWORDS = (b"password", b"api_key", b"secret", b"token")
+SECRET_RE = re.compile(rb'(?i)(password|api_key|secret|token)\s*=\s*["\'][^"\']+["\']')
+SECRET_SCAN_MAX_SIZE = 512 * 1024  # fixtures gerados não guardam secrets
+
+SECRET_SCAN_WORKERS = 8
+
+def _has_secret(path: str) -> bool:
+    """Indica se o arquivo .rs parece conter uma credencial hardcoded"""
+    try:
+        if os.path.getsize(path) > SECRET_SCAN_MAX_SIZE:
+            return False
+        with open(path, "rb") as f:
+            content = f.read()
+    except OSError:
+        return False
+    content_lower = content.lower()
+    # Busca de substring é bem mais barata que a regex
+    if not any(k in content_lower for k in SECRET_KEYWORDS):
+        return False
+    if not SECRET_RE.search(content):
+        return False
+    # Ignorar se estiver em comentários de teste ou exemplo
+    return b"test" not in content_lower and b"example" not in content_lower
+
+def _kill_process_group(proc: subprocess.Popen) -> None:
+    """Mata o processo e seus filhos (grupo criado com start_new_session)"""
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+    except OSError:
+        pass
+
+@functools.lru_cache(maxsize=4096)
+def _relpath(path: str, start: str) -> str:
+    return os.path.relpath(path, start)
+
+# Badges e seções do README, contados numa única passada
+README_RE = re.compile(r"img\.shields\.io|docs\.rs/badge|## (?:Instalação|Installation|Quickstart)|```rust")
 
 class QualityChecker:
+    __slots__ = (
+        "crate_dir",
+        "errors",
+        "warnings",
+        "_large_files",
+        "_rs_files_by_dir",
+        "_file_index",
+        "_top_level",
+        "_metadata",
+        "_metadata_loaded",
+        "_content_cache",
+        "_out",
+        "_interactive",
+    )
+    
     def __init__(self, crate_dir: Path):
         self.crate_dir = Path(crate_dir).resolve()
         self.errors: List[Tuple[str, str]] = []
         self.warnings: List[Tuple[str, str]] = []
-        
+        self._large_files: Optional[List[Tuple[str, int]]] = None
+        self._rs_files_by_dir: Dict[str, List[str]] = {}
+        self._file_index: Set[str] = set()
+        self._top_level: Set[str] = set()
+        self._metadata: Optional[dict] = None
+        self._metadata_loaded = False
+        self._content_cache: Dict[str, str] = {}
+        self._out: List[str] = []
+        self._interactive = sys.stdout.isatty()
+    
+    def _emit(self, line: str) -> None:
+        """Acumula uma linha de saída; em terminal interativo, escreve na hora"""
+        self._out.append(line)
+        if self._interactive:
+            self._flush()
+    
+    def _flush(self) -> None:
+        """Escreve as linhas acumuladas numa única chamada"""
+        if self._out:
+            sys.stdout.write("\n".join(self._out) + "\n")
+            sys.stdout.flush()
+            self._out.clear()
+    
+    def pass_(self, msg: str) -> None:
+        self._emit(f"✅ {msg}")
+    
+    def fail(self, desc: str, reason: str) -> None:
+        self._emit(f"❌ {desc} - {reason}")
+        self.errors.append((desc, reason))
+    
+    def warn(self, desc: str, reason: str) -> None:
+        self._emit(f"⚠️  {desc} - {reason}")
+        self.warnings.append((desc, reason))
+    
+    @staticmethod
+    def _is_pruned(entry: os.DirEntry, rel_dir: str) -> bool:
+        if not rel_dir:
+            return entry.name in PRUNED_ROOT_DIRS
+        if entry.name in PRUNED_DIRS:
+            return True
+        return entry.name == "target" and os.path.exists(os.path.join(entry.path, CARGO_TARGET_MARKER))
+    
+    def _scan_tree(self) -> None:
+        """Percorre a crate uma única vez (podando target/, .git/ etc.),
+        indexando os arquivos e as entradas da raiz e coletando arquivos
+        grandes e os .rs de cada diretório de topo. Segue symlinks como
+        Path.exists() (ex.: .github -> ../../.github), sem repetir diretórios"""
+        if self._large_files is not None:
+            return
+        large_files: List[Tuple[str, int]] = []
+        rs_files: Dict[str, List[str]] = {}
+        file_index: Set[str] = set()
+        top_level: Set[str] = set()
+        # Pilha de (diretório absoluto, caminho relativo, diretório de topo,
+        # (st_dev, st_ino) dos ancestrais). Só se corta um diretório que já é
+        # ancestral do caminho atual (loop de symlink); dois symlinks para o
+        # mesmo diretório contam cada um os seus arquivos, como no rglob
+        stack: List[Tuple[str, str, str, Tuple[Tuple[int, int], ...]]] = [(str(self.crate_dir), "", "", ())]
+        while stack:
+            dir_path, rel_dir, top, ancestors = stack.pop()
+            try:
+                st = os.stat(dir_path)
+                entries = os.scandir(dir_path)
+            except OSError:
+                continue
+            key = (st.st_dev, st.st_ino)
+            if key in ancestors:
+                entries.close()
+                continue
+            ancestors += (key,)
+            with entries:
+                for entry in entries:
+                    name = entry.name
+                    rel = rel_dir + name
+                    # Symlink quebrado não conta como existente
+                    if entry.is_symlink() and not os.path.exists(entry.path):
+                        continue
+                    if not rel_dir:
+                        top_level.add(name)
+                    if entry.is_dir():
+                        if not self._is_pruned(entry, rel_dir):
+                            stack.append((entry.path, rel + os.sep, top or name, ancestors))
+                        continue
+                    file_index.add(rel)
+                    if not entry.is_file():
+                        continue
+                    if top and name.endswith(".rs"):
+                        rs_files.setdefault(top, []).append(entry.path)
+                    if name.endswith(LARGE_FILE_EXEMPT):
+                        continue
+                    try:
+                        size = entry.stat().st_size
+                    except OSError:
+                        continue
+                    if size > LARGE_FILE_LIMIT:
+                        large_files.append((entry.path, size))
+        self._large_files = large_files
+        self._rs_files_by_dir = rs_files
+        self._file_index = file_index
+        self._top_level = top_level
+    
+    def _rel(self, path: str) -> str:
+        """Caminho relativo à crate, para exibição"""
+        return _relpath(path, str(self.crate_dir))
+    
+    def _read(self, file: str) -> str:
+        """Lê um arquivo da crate, uma única vez por caminho"""
+        content = self._content_cache.get(file)
+        if content is None:
+            content = (self.crate_dir / file).read_text(encoding='utf-8')
+            self._content_cache[file] = content
+        return content
+    
     def check_file(self, file: str, required: bool = True, desc: Optional[str] = None) -> bool:
         """Verifica se arquivo existe"""
-        path = self.crate_dir / file
+        self._scan_tree()
         desc = desc or file
-        if path.exists():
-            print(f"✅ {desc}")
+        if os.path.normpath(file) in self._file_index:
+            self._emit(f"✅ {desc}")
             return True
         else:
             if required:
-                print(f"❌ {desc} (OBRIGATÓRIO - faltando)")
+                self._emit(f"❌ {desc} (OBRIGATÓRIO - faltando)")
                 self.errors.append((desc, f"Arquivo obrigatório faltando: {file}"))
                 return False
             else:
-                print(f"⚠️  {desc} (recomendado - faltando)")
+                self._emit(f"⚠️  {desc} (recomendado - faltando)")
                 self.warnings.append((desc, f"Arquivo recomendado faltando: {file}"))
                 return False
     
     def check_content(self, file: str, pattern: str, desc: str, required: bool = True) -> bool:
         """Verifica se arquivo contém padrão"""
-        path = self.crate_dir / file
-        if not path.exists():
-            if required:
-                print(f"❌ {desc} (arquivo não existe)")
-                self.errors.append((desc, f"Arquivo não existe: {file}"))
-            return False
-        
         try:
-            content = path.read_text(encoding='utf-8')
+            content = self._read(file)
             if pattern in content:
-                print(f"✅ {desc}")
+                self._emit(f"✅ {desc}")
                 return True
             else:
                 if required:
-                    print(f"❌ {desc} (padrão '{pattern}' não encontrado)")
+                    self._emit(f"❌ {desc} (padrão '{pattern}' não encontrado)")
                     self.errors.append((desc, f"Padrão não encontrado em {file}"))
                 else:
-                    print(f"⚠️  {desc} (padrão '{pattern}' não encontrado)")
+                    self._emit(f"⚠️  {desc} (padrão '{pattern}' não encontrado)")
                     self.warnings.append((desc, f"Padrão não encontrado em {file}"))
                 return False
+        except FileNotFoundError:
+            if required:
+                self._emit(f"❌ {desc} (arquivo não existe)")
+                self.errors.append((desc, f"Arquivo não existe: {file}"))
+            return False
         except Exception as e:
             if required:
-                print(f"❌ {desc} (erro ao ler: {e})")
+                self._emit(f"❌ {desc} (erro ao ler: {e})")
                 self.errors.append((desc, f"Erro ao ler {file}: {e}"))
             return False
     
+    def _report_field(self, found: bool, field: str, desc: str, required: bool = True) -> bool:
+        if found:
+            self._emit(f"✅ {desc}")
+            return True
+        if required:
+            self._emit(f"❌ {desc} (campo '{field}' não encontrado)")
+            self.errors.append((desc, f"Campo '{field}' não encontrado em Cargo.toml"))
+        else:
+            self._emit(f"⚠️  {desc} (campo '{field}' não encontrado)")
+            self.warnings.append((desc, f"Campo '{field}' não encontrado em Cargo.toml"))
+        return False
+    
+    def _check_toml_key(self, data: dict, keys: Tuple[str, ...], field: str, desc: str, required: bool = True) -> bool:
+        """Verifica se a chave existe no Cargo.toml já parseado; `field` é o
+        nome exibido, o mesmo da busca textual"""
+        node = data
+        for key in keys:
+            if not isinstance(node, dict) or key not in node:
+                return self._report_field(False, field, desc, required)
+            node = node[key]
+        return self._report_field(True, field, desc, required)
+    
+    def check_cargo_toml(self) -> None:
+        """Verifica os campos obrigatórios e recomendados do Cargo.toml"""
+        try:
+            content = self._read("Cargo.toml")
+        except (OSError, UnicodeDecodeError) as e:
+            # Mesmas mensagens de check_content, sem reabrir o arquivo por campo
+            for _, _, desc, required in CARGO_TOML_FIELDS:
+                if not required:
+                    continue
+                if isinstance(e, FileNotFoundError):
+                    self._emit(f"❌ {desc} (arquivo não existe)")
+                    self.errors.append((desc, "Arquivo não existe: Cargo.toml"))
+                else:
+                    self._emit(f"❌ {desc} (erro ao ler: {e})")
+                    self.errors.append((desc, f"Erro ao ler Cargo.toml: {e}"))
+            return
+        
+        data = None
+        if tomllib is not None:
+            try:
+                data = tomllib.loads(content)
+            except tomllib.TOMLDecodeError:
+                pass
+        
+        if data is not None:
+            for keys, field, desc, required in CARGO_TOML_FIELDS:
+                self._check_toml_key(data, keys, field, desc, required)
+            return
+        
+        # Sem tomllib (ou TOML inválido): uma única passada de regex
+        seen: Set[str] = set()
+        section = ""
+        for header, key in CARGO_TOML_KEY_RE.findall(content):
+            if header:
+                section = header
+                if section == "package.metadata.docs.rs":
+                    seen.add("[package.metadata.docs.rs]")
+            elif section == "package":
+                seen.add(key)
+        for _, key, desc, required in CARGO_TOML_FIELDS:
+            self._report_field(key in seen, key, desc, required)
+    
     def check_rs_files(self, dir_path: str, min_count: int, desc: str, required: bool = True) -> bool:
         """Conta arquivos .rs em diretório"""
-        path = self.crate_dir / dir_path
-        if not path.exists():
+        self._scan_tree()
+        if dir_path not in self._top_level:
             if required:
-                print(f"❌ {desc} (diretório não existe)")
+                self._emit(f"❌ {desc} (diretório não existe)")
                 self.errors.append((desc, f"Diretório não existe: {dir_path}"))
             else:
-                print(f"⚠️  {desc} (diretório não existe)")
+                self._emit(f"⚠️  {desc} (diretório não existe)")
                 self.warnings.append((desc, f"Diretório não existe: {dir_path}"))
             return False
         
-        count = sum(1 for p in path.rglob("*.rs") if p.is_file())
+        count = len(self._rs_files_by_dir.get(dir_path, ()))
         if count >= min_count:
-            print(f"✅ {desc} ({count} arquivos .rs, mínimo: {min_count})")
+            self._emit(f"✅ {desc} ({count} arquivos .rs, mínimo: {min_count})")
             return True
         else:
             if required:
-                print(f"❌ {desc} (apenas {count} arquivo(s), mínimo: {min_count})")
+                self._emit(f"❌ {desc} (apenas {count} arquivo(s), mínimo: {min_count})")
                 self.errors.append((desc, f"Apenas {count} arquivo(s) .rs, mínimo: {min_count}"))
             else:
-                print(f"⚠️  {desc} (apenas {count} arquivo(s), recomendado: {min_count})")
+                self._emit(f"⚠️  {desc} (apenas {count} arquivo(s), recomendado: {min_count})")
                 self.warnings.append((desc, f"Apenas {count} arquivo(s) .rs, recomendado: {min_count}"))
             return False
     
-    def check_cargo_command(self, args: List[str], desc: str, required: bool = True) -> bool:
-        """Executa comando cargo e verifica sucesso"""
+    def _cargo_metadata(self) -> Optional[dict]:
+        """`cargo metadata --no-deps`, executado uma única vez por crate"""
+        if not self._metadata_loaded:
+            self._metadata_loaded = True
+            try:
+                result = subprocess.run(
+                    ["cargo", "metadata", "--no-deps", "--format-version", "1"],
+                    cwd=self.crate_dir,
+                    capture_output=True,
+                    text=True,
+                    timeout=60
+                )
+                if result.returncode == 0:
+                    self._metadata = json.loads(result.stdout)
+            except (OSError, subprocess.TimeoutExpired, ValueError):
+                pass
+        return self._metadata
+    
+    def _rustfmt_command(self) -> Optional[List[str]]:
+        """Equivalente direto de `cargo fmt --all -- --check`: chama o rustfmt
+        com os arquivos raiz de cada target, sem passar pelo cargo"""
+        metadata = self._cargo_metadata()
+        rustfmt = shutil.which("rustfmt")
+        if metadata is None or rustfmt is None:
+            return None
+        editions = set()
+        files: List[str] = []
+        for package in metadata.get("packages", []):
+            for target in package.get("targets", []):
+                editions.add(target.get("edition", package.get("edition")))
+                if target["src_path"] not in files:
+                    files.append(target["src_path"])
+        # Com edições diferentes entre targets, deixa o cargo resolver
+        if len(editions) != 1 or not files:
+            return None
+        return [rustfmt, "--check", "--edition", editions.pop()] + files
+    
+    def _command_for(self, args: List[str]) -> List[str]:
+        if args == ["fmt", "--all", "--", "--check"]:
+            command = self._rustfmt_command()
+            if command is not None:
+                return command
+        return ["cargo"] + args
+    
+    async def _run_cargo(self, command: List[str]) -> Union[int, Exception]:
+        """Executa o comando e retorna o código de saída (ou a exceção).
+        Só o código de saída importa, então a saída é descartada em vez de
+        acumulada em memória"""
         try:
-            result = subprocess.run(
-                ["cargo"] + args,
+            proc = await asyncio.create_subprocess_exec(
+                *command,
                 cwd=self.crate_dir,
-                capture_output=True,
-                text=True,
-                timeout=300
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
             )
-            if result.returncode == 0:
-                print(f"✅ {desc}")
-                return True
-            else:
-                if required:
-                    print(f"❌ {desc} (comando falhou)")
-                    self.errors.append((desc, f"Comando falhou: cargo {' '.join(args)}"))
-                else:
-                    print(f"⚠️  {desc} (comando falhou)")
-                    self.warnings.append((desc, f"Comando falhou: cargo {' '.join(args)}"))
-                return False
-        except FileNotFoundError:
+        except FileNotFoundError as e:
+            return e
+        try:
+            await asyncio.wait_for(proc.wait(), timeout=CARGO_TIMEOUT)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return subprocess.TimeoutExpired(command, CARGO_TIMEOUT)
+        return proc.returncode
+    
+    async def _run_cargo_chains(self, chains: List[List[List[str]]]) -> List[List[Union[int, Exception]]]:
+        """Cadeias rodam em paralelo; comandos de uma mesma cadeia, em sequência"""
+        async def run_chain(chain: List[List[str]]) -> List[Union[int, Exception]]:
+            return [await self._run_cargo(command) for command in chain]
+        return list(await asyncio.gather(*(run_chain(chain) for chain in chains)))
+    
+    def _report_cargo(self, args: List[str], desc: str, required: bool, outcome: Union[int, Exception]) -> bool:
+        if isinstance(outcome, FileNotFoundError):
             if required:
-                print(f"❌ {desc} (cargo não encontrado)")
+                self._emit(f"❌ {desc} (cargo não encontrado)")
                 self.errors.append((desc, "cargo não encontrado"))
             else:
-                print(f"⚠️  {desc} (cargo não encontrado)")
+                self._emit(f"⚠️  {desc} (cargo não encontrado)")
                 self.warnings.append((desc, "cargo não encontrado"))
             return False
-        except subprocess.TimeoutExpired:
+        if isinstance(outcome, subprocess.TimeoutExpired):
             if required:
-                print(f"❌ {desc} (timeout)")
+                self._emit(f"❌ {desc} (timeout)")
                 self.errors.append((desc, "Comando excedeu timeout"))
             return False
+        if outcome == 0:
+            self._emit(f"✅ {desc}")
+            return True
+        if required:
+            self._emit(f"❌ {desc} (comando falhou)")
+            self.errors.append((desc, f"Comando falhou: cargo {' '.join(args)}"))
+        else:
+            self._emit(f"⚠️  {desc} (comando falhou)")
+            self.warnings.append((desc, f"Comando falhou: cargo {' '.join(args)}"))
+        return False
+    
+    def check_cargo_commands(self, chains: List[List[CargoCheck]]) -> List[bool]:
+        """Executa cadeias independentes de comandos cargo em paralelo e
+        reporta os resultados na ordem em que foram declarados"""
+        commands = [[self._command_for(args) for args, _, _ in chain] for chain in chains]
+        self._flush()
+        outcomes = asyncio.run(self._run_cargo_chains(commands))
+        return [
+            self._report_cargo(args, desc, required, outcome)
+            for chain, chain_outcomes in zip(chains, outcomes)
+            for (args, desc, required), outcome in zip(chain, chain_outcomes)
+        ]
+    
+    def check_cargo_command(self, args: List[str], desc: str, required: bool = True) -> bool:
+        """Executa comando cargo e verifica sucesso"""
+        return self.check_cargo_commands([[(args, desc, required)]])[0]
+    
+    def _udeps_reports_unused(self, timeout: int = 60) -> bool:
+        """Roda `cargo udeps` lendo a saída linha a linha e para na primeira
+        menção a dependências não utilizadas"""
+        # Sessão própria: o cargo executa o cargo-udeps como filho, que herda o
+        # pipe; só matando o grupo inteiro a leitura recebe EOF no timeout
+        proc = subprocess.Popen(
+            ["cargo", "udeps", "--all-targets", "--all-features"],
+            cwd=self.crate_dir,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            errors="replace",
+            start_new_session=hasattr(os, "killpg"),
+        )
+        timed_out = threading.Event()
+        def kill_on_timeout() -> None:
+            timed_out.set()
+            _kill_process_group(proc)
+        timer = threading.Timer(timeout, kill_on_timeout)
+        timer.start()
+        try:
+            found = any("unused dependencies" in line.lower() for line in proc.stdout)
+        finally:
+            timer.cancel()
+            # Encerra filhos remanescentes (saída antecipada ou já terminados)
+            _kill_process_group(proc)
+            proc.stdout.close()
+            proc.wait()
+        if timed_out.is_set() and not found:
+            raise subprocess.TimeoutExpired(proc.args, timeout)
+        return found
     
     def check_readme_quality(self) -> None:
         """Verifica qualidade do README.md"""
-        readme_path = self.crate_dir / "README.md"
-        if not readme_path.exists():
-            return
-        
         try:
-            content = readme_path.read_text(encoding='utf-8')
+            content = self._read("README.md")
+            
+            hits = Counter(README_RE.findall(content))
             
             # Contar badges
-            badge_count = content.count("img.shields.io") + content.count("docs.rs/badge")
+            badge_count = hits["img.shields.io"] + hits["docs.rs/badge"]
             if badge_count >= 3:
-                print(f"✅ README.md com {badge_count} badges (bom)")
+                self._emit(f"✅ README.md com {badge_count} badges (bom)")
             elif badge_count >= 1:
-                print(f"⚠️  README.md com apenas {badge_count} badge(s) (recomendado: 3+)")
+                self._emit(f"⚠️  README.md com apenas {badge_count} badge(s) (recomendado: 3+)")
                 self.warnings.append(("README badges", f"Apenas {badge_count} badge(s)"))
             else:
-                print(f"⚠️  README.md sem badges (recomendado adicionar)")
+                self._emit(f"⚠️  README.md sem badges (recomendado adicionar)")
                 self.warnings.append(("README badges", "Sem badges"))
             
             # Verificar seções
-            if "## Instalação" in content or "## Installation" in content:
-                print("✅ Seção 'Instalação' no README")
+            if hits["## Instalação"] or hits["## Installation"]:
+                self._emit("✅ Seção 'Instalação' no README")
             else:
                 self.warnings.append(("README", "Seção 'Instalação' não encontrada"))
             
-            if "## Quickstart" in content or "```rust" in content:
-                print("✅ Seção Quickstart/Exemplo no README")
+            if hits["## Quickstart"] or hits["```rust"]:
+                self._emit("✅ Seção Quickstart/Exemplo no README")
             else:
                 self.warnings.append(("README", "Seção Quickstart/Exemplo não encontrada"))
+        except FileNotFoundError:
+            return
         except Exception as e:
             self.warnings.append(("README", f"Erro ao verificar: {e}"))
     
     def run_all_checks(self) -> None:
         """Executa todas as verificações"""
-        print(f"🔍 Verificando qualidade da crate")
-        print(f"📁 Diretório: {self.crate_dir}\n")
+        self._emit(f"🔍 Verificando qualidade da crate")
+        self._emit(f"📁 Diretório: {self.crate_dir}\n")
         
-        print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-        print("📋 FASE 1: ESTRUTURA BÁSICA")
-        print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        self._emit("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        self._emit("📋 FASE 1: ESTRUTURA BÁSICA")
+        self._emit("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
         self.check_file("Cargo.toml", True)
         self.check_file("README.md", True)
         self.check_file("LICENSE", True)
@@ -170,62 +566,66 @@ class QualityChecker:
         self.check_file("CHANGELOG.md", False)
         self.check_file("CITATION.cff", False)
         
-        print("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-        print("📋 FASE 2: CONFIGURAÇÃO CARGO.TOML")
-        print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-        self.check_content("Cargo.toml", "name =", "Campo 'name'", True)
-        self.check_content("Cargo.toml", "version =", "Campo 'version'", True)
-        self.check_content("Cargo.toml", "edition =", "Campo 'edition'", True)
-        self.check_content("Cargo.toml", "license =", "Campo 'license'", True)
-        self.check_content("Cargo.toml", "description =", "Campo 'description'", True)
-        self.check_content("Cargo.toml", "repository =", "Campo 'repository'", True)
-        self.check_content("Cargo.toml", "readme =", "Campo 'readme'", True)
-        self.check_content("Cargo.toml", "rust-version =", "Campo 'rust-version'", True)
-        self.check_content("Cargo.toml", "documentation =", "Campo 'documentation'", True)
-        self.check_content("Cargo.toml", "exclude", "Campo 'exclude'", False)
-        self.check_content("Cargo.toml", "[package.metadata.docs.rs]", "Seção docs.rs", False)
+        self._flush()
         
-        print("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-        print("📋 FASE 3: ESTRUTURA DE CÓDIGO")
-        print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        self._emit("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        self._emit("📋 FASE 2: CONFIGURAÇÃO CARGO.TOML")
+        self._emit("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        self.check_cargo_toml()
+        
+        self._flush()
+        
+        self._emit("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        self._emit("📋 FASE 3: ESTRUTURA DE CÓDIGO")
+        self._emit("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
         self.check_rs_files("src", 1, "Diretório src/", True)
         self.check_rs_files("tests", 2, "Diretório tests/", True)
         self.check_rs_files("examples", 1, "Diretório examples/", True)
         self.check_rs_files("benches", 1, "Diretório benches/", False)
         
-        print("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-        print("📋 FASE 4: SEGURANÇA E QUALIDADE")
-        print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        self._flush()
+        
+        self._emit("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        self._emit("📋 FASE 4: SEGURANÇA E QUALIDADE")
+        self._emit("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
         self.check_file("SECURITY.md", False)
         self.check_file("CODE_OF_CONDUCT.md", False)
         self.check_file("deny.toml", False)
         self.check_content("src/lib.rs", "#![forbid(unsafe_code)]", "#![forbid(unsafe_code)]", False)
         
-        print("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-        print("📋 FASE 5: CI/CD E WORKFLOWS")
-        print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        self._flush()
+        
+        self._emit("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        self._emit("📋 FASE 5: CI/CD E WORKFLOWS")
+        self._emit("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
         self.check_file(".github/workflows/ci.yml", False, "Workflow CI")
         self.check_file(".github/workflows/audit.yml", False, "Workflow Audit")
         self.check_file(".github/workflows/deny.yml", False, "Workflow Deny")
         self.check_file(".github/workflows/sbom.yml", False, "Workflow SBOM")
         
-        print("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-        print("📋 FASE 6: TEMPLATES GITHUB")
-        print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        self._flush()
+        
+        self._emit("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        self._emit("📋 FASE 6: TEMPLATES GITHUB")
+        self._emit("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
         self.check_file(".github/ISSUE_TEMPLATE/bug_report.md", False, "Template Bug Report")
         self.check_file(".github/ISSUE_TEMPLATE/feature_request.md", False, "Template Feature Request")
         self.check_file(".github/ISSUE_TEMPLATE/config.yml", False, "Template Config")
         self.check_file(".github/pull_request_template.md", False, "Template Pull Request")
         
-        print("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-        print("📋 FASE 7: DOCUMENTAÇÃO")
-        print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        self._flush()
+        
+        self._emit("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        self._emit("📋 FASE 7: DOCUMENTAÇÃO")
+        self._emit("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
         self.check_readme_quality()
         self.check_file("RELEASE_NOTES.md", False)
         
-        print("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-        print("📋 FASE 9: ANTI-PADRÕES (O QUE NÃO DEVE ESTAR)")
-        print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        self._flush()
+        
+        self._emit("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        self._emit("📋 FASE 9: ANTI-PADRÕES (O QUE NÃO DEVE ESTAR)")
+        self._emit("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
         
         # Verificar arquivos proibidos
         forbidden_files = [
@@ -238,79 +638,59 @@ class QualityChecker:
             (".vscode", "Diretório .vscode/ não deve estar no repositório", False),
         ]
         
+        self._scan_tree()
         for file, desc, is_error in forbidden_files:
-            path = self.crate_dir / file
-            if path.exists():
+            if file in self._top_level:
                 if is_error:
                     self.fail(desc, f"Arquivo proibido encontrado: {file}")
                 else:
                     self.warn(desc, f"Arquivo não recomendado: {file}")
             else:
-                self.pass(f"{desc} (não encontrado)")
+                self.pass_(f"{desc} (não encontrado)")
         
         # Verificar arquivos grandes
         try:
-            large_files = []
-            for path in self.crate_dir.rglob("*"):
-                if path.is_file() and path.stat().st_size > 1024 * 1024:  # >1MB
-                    if path.suffix not in [".md", ".pdf", ".png", ".jpg", ".jpeg"]:
-                        if "target" not in str(path) and ".git" not in str(path):
-                            large_files.append(path)
+            self._scan_tree()
+            large_files = self._large_files
             
             if large_files:
                 self.warn("Arquivos grandes encontrados", f"{len(large_files)} arquivo(s) >1MB")
-                for f in large_files[:5]:
-                    size_mb = f.stat().st_size / (1024 * 1024)
-                    print(f"   ⚠️  {f.relative_to(self.crate_dir)} ({size_mb:.1f}MB)")
+                for f, size in large_files[:5]:
+                    size_mb = size / (1024 * 1024)
+                    self._emit(f"   ⚠️  {self._rel(f)} ({size_mb:.1f}MB)")
             else:
-                self.pass("Nenhum arquivo grande desnecessário encontrado")
+                self.pass_("Nenhum arquivo grande desnecessário encontrado")
         except Exception as e:
             self.warn("Verificação de arquivos grandes", f"Erro: {e}")
         
         # Verificar secrets hardcoded
         try:
-            secret_patterns = [
-                (r'password\s*=\s*["\'][^"\']+["\']', "password"),
-                (r'api_key\s*=\s*["\'][^"\']+["\']', "api_key"),
-                (r'secret\s*=\s*["\'][^"\']+["\']', "secret"),
-                (r'token\s*=\s*["\'][^"\']+["\']', "token"),
-            ]
-            
+            self._scan_tree()
             found_secrets = False
-            for pattern, name in secret_patterns:
-                for path in (self.crate_dir / "src").rglob("*.rs"):
-                    try:
-                        content = path.read_text(encoding='utf-8')
-                        if re.search(pattern, content, re.IGNORECASE):
-                            # Ignorar se estiver em comentários de teste ou exemplo
-                            if "test" not in content.lower() and "example" not in content.lower():
-                                found_secrets = True
-                                break
-                    except:
-                        pass
-                if found_secrets:
-                    break
+            # Leitura é I/O puro (libera o GIL); para no primeiro achado
+            with ThreadPoolExecutor(max_workers=SECRET_SCAN_WORKERS) as ex:
+                futures = [ex.submit(_has_secret, path) for path in self._rs_files_by_dir.get("src", ())]
+                for future in as_completed(futures):
+                    if future.result():
+                        found_secrets = True
+                        for pending in futures:
+                            pending.cancel()
+                        break
             
             if found_secrets:
                 self.fail("Possíveis secrets/credenciais hardcoded", "VERIFICAR código fonte!")
             else:
-                self.pass("Nenhum secret/credencial hardcoded detectado")
+                self.pass_("Nenhum secret/credencial hardcoded detectado")
         except Exception as e:
             self.warn("Verificação de secrets", f"Erro: {e}")
         
         # Verificar dependências não utilizadas
         try:
-            result = subprocess.run(
-                ["cargo", "udeps", "--all-targets", "--all-features"],
-                cwd=self.crate_dir,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            if "unused dependencies" in result.stdout.lower() or "unused dependencies" in result.stderr.lower():
+            self._flush()
+            if self._udeps_reports_unused():
                 self.warn("Dependências não utilizadas", "Executar: cargo udeps")
             else:
-                self.pass("Nenhuma dependência não utilizada (cargo udeps)")
+                self.pass_("Nenhuma dependência não utilizada (cargo udeps)")
         except FileNotFoundError:
             self.warn("cargo-udeps", "Não instalado (recomendado)")
         except subprocess.TimeoutExpired:
@@ -318,48 +698,56 @@ class QualityChecker:
         except:
             pass  # cargo-udeps pode não estar instalado
         
-        print("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-        print("📋 FASE 8: VALIDAÇÃO DE CÓDIGO")
-        print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-        self.check_cargo_command(["fmt", "--all", "--", "--check"], "cargo fmt", True)
-        
-        # Clippy (não crítico se não estiver instalado)
-        try:
-            self.check_cargo_command(["clippy", "--all-targets", "--all-features", "--", "-D", "warnings"], "cargo clippy", False)
-        except:
-            pass
+        self._flush()
         
-        self.check_cargo_command(["test", "--all-features"], "cargo test", True)
+        self._emit("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        self._emit("📋 FASE 8: VALIDAÇÃO DE CÓDIGO")
+        self._emit("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        # fmt não compila nada e roda em paralelo; clippy e test compartilham
+        # target/ e rodam em sequência para não disputar o lock do cargo.
+        # Clippy não é crítico se não estiver instalado.
+        self.check_cargo_commands([
+            [(["fmt", "--all", "--", "--check"], "cargo fmt", True)],
+            [
+                (["clippy", "--all-targets", "--all-features", "--", "-D", "warnings"], "cargo clippy", False),
+                (["test", "--all-features"], "cargo test", True),
+            ],
+        ])
+        self._flush()
     
     def print_summary(self) -> int:
         """Imprime resumo e retorna código de saída"""
-        print("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-        print("📊 RESUMO FINAL")
-        print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        self._flush()
+        self._emit("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        self._emit("📊 RESUMO FINAL")
+        self._emit("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
         
         if not self.errors and not self.warnings:
-            print("✅ PERFEITO! Nenhum erro ou warning encontrado.")
-            print("✅ Crate atende ao padrão completo de qualidade!")
+            self._emit("✅ PERFEITO! Nenhum erro ou warning encontrado.")
+            self._emit("✅ Crate atende ao padrão completo de qualidade!")
+            self._flush()
             return 0
         elif not self.errors:
-            print(f"⚠️  ATENÇÃO: {len(self.warnings)} warning(s) encontrado(s)")
-            print("✅ Nenhum erro crítico. Crate atende ao padrão mínimo.")
+            self._emit(f"⚠️  ATENÇÃO: {len(self.warnings)} warning(s) encontrado(s)")
+            self._emit("✅ Nenhum erro crítico. Crate atende ao padrão mínimo.")
             if self.warnings:
-                print("\nWarnings:")
+                self._emit("\nWarnings:")
                 for desc, msg in self.warnings:
-                    print(f"  - {desc}: {msg}")
+                    self._emit(f"  - {desc}: {msg}")
+            self._flush()
             return 0
         else:
-            print(f"❌ ERRO: {len(self.errors)} erro(s) e {len(self.warnings)} warning(s) encontrado(s)")
-            print("❌ Crate NÃO atende ao padrão mínimo de qualidade.")
+            self._emit(f"❌ ERRO: {len(self.errors)} erro(s) e {len(self.warnings)} warning(s) encontrado(s)")
+            self._emit("❌ Crate NÃO atende ao padrão mínimo de qualidade.")
             if self.errors:
-                print("\nErros:")
+                self._emit("\nErros:")
                 for desc, msg in self.errors:
-                    print(f"  - {desc}: {msg}")
+                    self._emit(f"  - {desc}: {msg}")
             if self.warnings:
-                print("\nWarnings:")
+                self._emit("\nWarnings:")
                 for desc, msg in self.warnings:
-                    print(f"  - {desc}: {msg}")
+                    self._emit(f"  - {desc}: {msg}")
+            self._flush()
             return 1
 
 def main():